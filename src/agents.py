@@ -46,7 +46,16 @@ class BaseAgent(ABC):
         self.model_name = None  # Will be set by subclasses
         self.model_name = config.get("model", "unknown")  # Store model name
         self.saved_memory: List[GameEvent] = []  # To track saved events
-        self.system_message = SystemMessage(self._create_system_prompt())
+        self.system_message = self._create_system_message()
+
+        # Stateful session: keep the conversation so that every turn only
+        # appends the new memory entries to an unchanged prefix, which lets the
+        # provider reuse its prompt cache. Not compatible with memory trimming.
+        self.stateful_session = (
+            config.get("stateful_session", False) and not self.memory_limit
+        )
+        self.session: List[BaseMessage] = []
+        self._session_memory_len = 0  # Memory entries already sent in the session
 
     @abstractmethod
     def initialize_llm(self):
@@ -59,7 +68,15 @@ class BaseAgent(ABC):
             self.initialize_llm()
 
         # Generate response
-        response = self.llm.invoke([self.system_message, HumanMessage(prompt)])
+        if self.stateful_session:
+            messages = [self.system_message, *self.session, HumanMessage(prompt)]
+        else:
+            messages = [self.system_message, HumanMessage(prompt)]
+        response = self.llm.invoke(messages)
+
+        if self.stateful_session:
+            self.session.extend([messages[-1], AIMessage(response.content)])
+            self._session_memory_len = len(self.player.memory)
 
         # DeepSeek Reason models:
         if "</think>" in response.content:
@@ -72,6 +89,22 @@ class BaseAgent(ABC):
 
         return content, inner_thought
 
+    def release(self):
+        """
+        Release the resources held by this agent once its player is eliminated.
+
+        The player's memory is kept so that inner thoughts still end up in the
+        transcript; only the LLM client and the event bookkeeping are dropped.
+        """
+        self.llm = None
+        self.saved_memory = []
+        self.reset_session()
+
+    def reset_session(self):
+        """Forget the conversation kept for a stateful session."""
+        self.session = []
+        self._session_memory_len = 0
+
     def _add_inner_thought(self, inner_thought: str, game_state: GameState):
         """
         Add inner thought to the player's memory.
@@ -183,8 +216,13 @@ class BaseAgent(ABC):
         if not self.player.memory:
             return "No events to remember yet."
 
-        memory_str = "Your Memory:\n"
-        for i, memory in enumerate(self.player.memory):
+        # In a stateful session the earlier entries are already in the conversation
+        start = self._session_memory_len if self.session else 0
+        if start:
+            memory_str = "New events since your last turn:\n"
+        else:
+            memory_str = "Your Memory:\n"
+        for i, memory in enumerate(self.player.memory[start:], start):
             if memory["type"] == "event":
                 memory_str += f"{i+1}. Round {memory['round']}, {memory['phase']}: {memory['description']}\n"
             elif memory["type"] == "message":
@@ -338,6 +376,10 @@ class BaseAgent(ABC):
             # Default to a neutral response if unclear
             return "neutral"
 
+    def _create_system_message(self) -> SystemMessage:
+        """Create the system message sent at the start of every request."""
+        return SystemMessage(self._create_system_prompt())
+
     def _create_system_prompt(self) -> str:
         """Create a system prompt for the agent."""
         nl = "\n"
@@ -632,6 +674,18 @@ class AnthropicAgent(BaseAgent):
             model_name=model_name, temperature=0.7, **self._get_monitoring_kwargs()
         )
 
+    def _create_system_message(self) -> SystemMessage:
+        """Create the system message, marked as cacheable for prompt caching."""
+        return SystemMessage(
+            [
+                {
+                    "type": "text",
+                    "text": self._create_system_prompt(),
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        )
+
     def _get_monitoring_kwargs(self) -> Dict[str, Any]:
         """Get monitoring kwargs for the LLM."""
 
@@ -36,6 +36,7 @@ DEFAULT_GAME_SETTINGS = {
         "verbosity": "elaborate",  # "brief" or "elaborate"
         "max_message_length": 200,  # Maximum length of agent messages
         "memory_limit": None,  # Number of past events to remember
+        "stateful_session": False,  # Send only new events each turn to reuse the provider's prompt cache
     },
     
     # Game mechanics
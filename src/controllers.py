@@ -2,9 +2,13 @@
 Game controllers for managing different phases of the Mafia game.
 """
 
+from collections import Counter
 from typing import Dict, List, Optional, Any, Tuple
+import asyncio
+import queue
 import random
 import logging
+import threading
 import uuid
 
 from src.models import (
@@ -37,6 +41,7 @@ class GameController:
         self.config = config
         self.game_state = None
         self.agents: Dict[str, BaseAgent] = {}
+        self.agents_alive: Dict[str, BaseAgent] = {}
         self.phase_controllers = {
             GamePhase.DAY_DISCUSSION: DayDiscussionController(self),
             GamePhase.DAY_VOTING: DayVotingController(self),
@@ -52,6 +57,7 @@ class GameController:
             # "elimination": [],
             "vote_result": [],
         }
+        self._event_queue: Optional[queue.Queue] = None
 
     def initialize_game(self, player_names: List[str]) -> GameState:
         """
@@ -90,13 +96,13 @@ class GameController:
             )
 
         # Create role assignment
+        role_by_name = {name: PlayerRole[name.upper()] for name in role_distribution}
         roles = []
         for role_name, count in role_distribution.items():
-            role = getattr(PlayerRole, role_name.upper())
-            roles.extend([role] * count)
+            roles.extend([role_by_name[role_name]] * count)
 
         # Shuffle roles
-        random.shuffle(roles)
+        roles = random.sample(roles, k=len(roles))
 
         # Create players
         players = {}
@@ -109,11 +115,14 @@ class GameController:
             # Initialize known roles (each player knows their own role)
             players[player_id].known_roles[player_id] = role
 
-            # If player is Mafia or Godfather, they know who the other Mafia members are
-            if role in [PlayerRole.MAFIA, PlayerRole.GODFATHER]:
-                for pid, p in players.items():
-                    if p.role in [PlayerRole.MAFIA, PlayerRole.GODFATHER]:
-                        players[player_id].known_roles[pid] = p.role
+        # Mafia and Godfather know who the other Mafia members are
+        mafia_ids = [
+            pid
+            for pid, p in players.items()
+            if p.role in (PlayerRole.MAFIA, PlayerRole.GODFATHER)
+        ]
+        for pid in mafia_ids:
+            players[pid].known_roles.update({m: players[m].role for m in mafia_ids})
 
         # Create initial game state
         self.game_state = GameState(
@@ -130,6 +139,7 @@ class GameController:
 
         # Initialize agents
         self._initialize_agents()
+        self._refresh_alive_agents()
 
         # Add initial game event
         self._add_game_event(
@@ -211,6 +221,31 @@ class GameController:
                 )
             self.agents[player_id] = agent
 
+    def _refresh_alive_agents(self):
+        """Rebuild the map of agents whose players are still alive."""
+        self.agents_alive = {
+            pid: agent
+            for pid, agent in self.agents.items()
+            if self.game_state.players[pid].is_alive
+        }
+
+    def eliminate_player(self, player_id: str):
+        """
+        Mark a player as dead and release their agent.
+
+        Args:
+            player_id: ID of the eliminated player
+        """
+        self.game_state.players[player_id].status = PlayerStatus.DEAD
+        self.agents_alive.pop(player_id, None)
+        for controller in self.phase_controllers.values():
+            controller._invalidate_alive_snapshot()
+
+        # Dead players never act again, so drop the agent's LLM state
+        agent = self.agents.get(player_id)
+        if agent is not None:
+            agent.release()
+
     def register_callback(self, event_type: str, callback):
         """
         Register a callback for a specific event type.
@@ -221,23 +256,82 @@ class GameController:
         """
         if event_type in self.event_callbacks:
             self.event_callbacks[event_type].append(callback)
+            self._start_event_dispatcher()
         else:
             logger.warning(f"Unknown event type: {event_type}")
 
+    def _start_event_dispatcher(self):
+        """Start the background thread that runs the event callbacks."""
+        if self._event_queue is not None:
+            return
+
+        self._event_queue = queue.Queue()
+        threading.Thread(
+            target=self._dispatch_loop, name="event-dispatcher", daemon=True
+        ).start()
+
+    def _dispatch_loop(self):
+        """Run the callbacks of queued events, in the order they were emitted."""
+        loop = asyncio.new_event_loop()
+        while True:
+            event_type, data = self._event_queue.get()
+            try:
+                self._dispatch_event(event_type, data, loop)
+            finally:
+                self._event_queue.task_done()
+
+    def _dispatch_event(self, event_type: str, data: Any, loop=None):
+        """
+        Call the callbacks registered for an event.
+
+        Coroutine callbacks are awaited concurrently after the plain ones.
+
+        Args:
+            event_type: Type of event
+            data: Event data to pass to callbacks
+            loop: Event loop used to run coroutine callbacks
+        """
+        coroutines = []
+        for callback in self.event_callbacks.get(event_type, []):
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    coroutines.append(callback(data))
+                else:
+                    callback(data)
+            except Exception as e:
+                logger.error(f"Error in {event_type} callback: {e}")
+
+        if coroutines:
+            if loop is None:
+                loop = asyncio.new_event_loop()
+            results = loop.run_until_complete(
+                asyncio.gather(*coroutines, return_exceptions=True)
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in {event_type} callback: {result}")
+
     def emit_event(self, event_type: str, data: Any):
         """
         Emit an event to all registered callbacks.
 
+        The callbacks run on a background thread so that slow observers (e.g.
+        the web UI) do not block the game loop. Use flush_events() to wait for
+        them.
+
         Args:
             event_type: Type of event
             data: Event data to pass to callbacks
         """
-        if event_type in self.event_callbacks:
-            for callback in self.event_callbacks[event_type]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    logger.error(f"Error in {event_type} callback: {e}")
+        if self._event_queue is not None:
+            self._event_queue.put_nowait((event_type, data))
+        else:
+            self._dispatch_event(event_type, data)
+
+    def flush_events(self):
+        """Wait until the callbacks of all emitted events have run."""
+        if self._event_queue is not None:
+            self._event_queue.join()
 
     def _add_game_event(
         self, event_type: str, description: str, public: bool, targets: List[str] = None
@@ -288,6 +382,8 @@ class GameController:
 
             self.phase_completed = False
 
+        self.flush_events()
+
         return self.game_state.game_over, self.game_state.winning_team
 
     def run_phase(self):
@@ -304,6 +400,9 @@ class GameController:
         # update agent memories
         controller._update_agent_memories()
 
+        # Let the observers catch up with the phase
+        self.flush_events()
+
         # Mark phase as completed
         self.phase_completed = True
 
@@ -360,7 +459,12 @@ class GameController:
 
     def check_game_over(self):
         """Check if the game is over and update the game state accordingly."""
+        self._refresh_alive_agents()
         if self.game_state.check_game_over():
+            # The conversations are not needed once the game has ended
+            for agent in self.agents.values():
+                agent.reset_session()
+
             winning_team = self.game_state.winning_team
             winning_team_name = (
                 "Village" if winning_team == TeamAlignment.VILLAGE else "Mafia"
@@ -385,14 +489,41 @@ class PhaseController:
             game_controller: The main game controller
         """
         self.game_controller = game_controller
+        self._alive_snapshot: Optional[Tuple[Player, ...]] = None
+        self._alive_ids: frozenset = frozenset()
 
     def run(self):
         """Run this phase."""
         raise NotImplementedError("Subclasses must implement run()")
 
+    def _snapshot_alive_players(self):
+        """Take a snapshot of the alive players, reused until the next elimination."""
+        self._alive_snapshot = tuple(
+            p for p in self.game_state.players.values() if p.is_alive
+        )
+        self._alive_ids = frozenset(p.id for p in self._alive_snapshot)
+
+    def _invalidate_alive_snapshot(self):
+        """Drop the alive players snapshot after an elimination."""
+        self._alive_snapshot = None
+
+    @property
+    def alive_snapshot(self) -> Tuple[Player, ...]:
+        """Get the players alive in this phase."""
+        if self._alive_snapshot is None:
+            self._snapshot_alive_players()
+        return self._alive_snapshot
+
+    @property
+    def alive_ids(self) -> frozenset:
+        """Get the IDs of the players alive in this phase."""
+        if self._alive_snapshot is None:
+            self._snapshot_alive_players()
+        return self._alive_ids
+
     def _update_agent_memories(self):
-        """Update all agents' memories with the current game state."""
-        for agent in self.agents.values():
+        """Update the memories of all agents whose players are still alive."""
+        for agent in self.game_controller.agents_alive.values():
             agent.update_memory(self.game_state)
 
     def emit_event(self, event_type: str, data: Any):
@@ -425,6 +556,9 @@ class DayDiscussionController(PhaseController):
             self.config.get("phases", {}).get("day", {}).get("discussion_rounds", 1)
         )
 
+        # Snapshot the alive players for this phase
+        self._snapshot_alive_players()
+
         # Update agent memories
         self._update_agent_memories()
 
@@ -440,7 +574,7 @@ class DayDiscussionController(PhaseController):
             round_num: The discussion round number
         """
         # Get alive players
-        alive_players = list(self.game_state.alive_players.values())
+        alive_players = self.alive_snapshot
 
         # Shuffle player order
         # random.shuffle(alive_players)
@@ -527,6 +661,9 @@ class DayVotingController(PhaseController):
             self.config.get("phases", {}).get("day", {}).get("voting_time", 1)
         )
 
+        # Snapshot the alive players for this phase
+        self._snapshot_alive_players()
+
         # Update agent memories
         self._update_agent_memories()
 
@@ -537,10 +674,10 @@ class DayVotingController(PhaseController):
     def _run_voting_round(self):
         """Run a single voting round."""
         # Get alive players
-        alive_players = list(self.game_state.alive_players.values())
+        alive_players = self.alive_snapshot
 
         # Each player casts a vote
-        votes = {}
+        votes = Counter()
         for player in alive_players:
             agent = self.agents[player.id]
 
@@ -555,7 +692,7 @@ class DayVotingController(PhaseController):
                 continue
 
             # Validate vote
-            if target_id not in self.game_state.alive_players or target_id == player.id:
+            if target_id not in self.alive_ids or target_id == player.id:
                 # Invalid vote,
                 logger.warning(
                     f"{player.name} attempted to vote for an invalid target: {target_id}"
@@ -577,7 +714,7 @@ class DayVotingController(PhaseController):
             self.emit_event("vote", vote)
 
             # Count vote
-            votes[target_id] = votes.get(target_id, 0) + 1
+            votes[target_id] += 1
 
             # Get target player name
             target_name = self.game_state.players[target_id].name
@@ -596,9 +733,10 @@ class DayVotingController(PhaseController):
         # Determine the player with the most votes
         if votes:
             # check if there is a tie
-            max_votes = max(votes.values())
-            tied_players = [pid for pid, count in votes.items() if count == max_votes]
-            if len(tied_players) > 1:
+            top = votes.most_common(2)
+            eliminated_id, max_votes = top[0]
+            if len(top) > 1 and top[1][1] == max_votes:
+                tied_players = [pid for pid, count in votes.items() if count == max_votes]
                 eliminated_players = [
                     self.game_state.players[pid].name for pid in tied_players
                 ]
@@ -612,11 +750,11 @@ class DayVotingController(PhaseController):
                 logger.info("No one was eliminated due to a tie!")
 
             else:
-                eliminated_id = max(votes.items(), key=lambda x: x[1])[0]
                 eliminated_player = self.game_state.players[eliminated_id]
 
                 # Eliminate the player
-                eliminated_player.status = PlayerStatus.DEAD
+                self.game_controller.eliminate_player(eliminated_id)
+                self._invalidate_alive_snapshot()
 
                 # Log elimination
                 logger.info(f"{eliminated_player.name} has been eliminated!")
@@ -661,15 +799,14 @@ class NightMafiaDiscussionController(PhaseController):
             .get("mafia_discussion_rounds", 2)
         )
 
+        # Snapshot the alive players for this phase
+        self._snapshot_alive_players()
+
         # Update agent memories
         self._update_agent_memories()
 
         # Get alive mafia players
-        alive_mafia = [
-            p
-            for p in self.game_state.alive_players.values()
-            if p.team == TeamAlignment.MAFIA
-        ]
+        alive_mafia = [p for p in self.alive_snapshot if p.team == TeamAlignment.MAFIA]
 
         # If no mafia left, skip this phase
         if not alive_mafia:
@@ -776,6 +913,9 @@ class NightActionController(PhaseController):
             self.config.get("phases", {}).get("night", {}).get("action_time", 1)
         )
 
+        # Snapshot the alive players for this phase
+        self._snapshot_alive_players()
+
         # Update agent memories
         self._update_agent_memories()
 
@@ -786,7 +926,7 @@ class NightActionController(PhaseController):
     def _run_action_round(self):
         """Run a single action round."""
         # Get alive players
-        alive_players = list(self.game_state.alive_players.values())
+        alive_players = self.alive_snapshot
 
         # Collect actions from all players
         actions = {}
@@ -909,7 +1049,8 @@ class NightActionController(PhaseController):
                 )
             else:
                 # Kill succeeded
-                target.status = PlayerStatus.DEAD
+                self.game_controller.eliminate_player(target_id)
+                self._invalidate_alive_snapshot()
 
                 # Mafia notification
                 self.game_controller._add_game_event(
@@ -969,6 +1110,7 @@ class RecordedGameController(GameController):
         self.config = transcript["config"]
         self.game_state = None
         self.agents: Dict[str, BaseAgent] = {}
+        self.agents_alive: Dict[str, BaseAgent] = {}
         self.phase_controllers = {
             GamePhase.DAY_DISCUSSION: DayDiscussionRecordController(self),
             GamePhase.DAY_VOTING: DayVotingRecordController(self),
@@ -985,6 +1127,7 @@ class RecordedGameController(GameController):
             # "elimination": [],
             "vote_result": [],
         }
+        self._event_queue: Optional[queue.Queue] = None
         self.game_id = transcript.get("game_id", str(uuid.uuid4()))
         self.game_over = False
 
@@ -1015,6 +1158,7 @@ class RecordedGameController(GameController):
 
         # Initialize agents
         self._initialize_agents()
+        self._refresh_alive_agents()
 
         # Add initial game event
         self._add_game_event()
@@ -1107,8 +1251,7 @@ class RecordedGameController(GameController):
         if event.event_type == "elimination":
             if event.targets:
                 # Update player status
-                eliminated_player = self.game_state.players[event.targets[0]]
-                eliminated_player.status = PlayerStatus.DEAD
+                self.eliminate_player(event.targets[0])
 
         # Add event to game state
         self.game_state.events.append(event)
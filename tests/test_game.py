@@ -216,6 +216,45 @@ class TestAgents(unittest.TestCase):
         # Check that memory was limited
         self.assertEqual(len(agent.player.memory), agent.memory_limit)
 
+    def test_stateful_session(self):
+        """Test that a stateful session only sends new memory entries."""
+        players = {
+            "player_1": self.player,
+            "player_2": Player(id="player_2", name="Bob", role=PlayerRole.MAFIA),
+        }
+        config = {
+            "max_message_length": 100,
+            "stateful_session": True,
+            "roles": {"Villager": 1, "Mafia": 1},
+            "players": players,
+        }
+        agent = OpenAIAgent(self.player, config)
+        agent.llm = MagicMock()
+        agent.llm.invoke.return_value = MagicMock(content="Hello")
+        game_state = GameState(players=players)
+
+        for description in ["First event.", "Second event."]:
+            game_state.events.append(GameEvent(
+                event_type="test",
+                round_num=1,
+                phase=GamePhase.DAY_DISCUSSION,
+                description=description,
+                public=True
+            ))
+            agent.update_memory(game_state)
+            agent.generate_day_discussion(game_state)
+
+        # The second request replays the first turn and only adds the new event
+        messages = agent.llm.invoke.call_args[0][0]
+        self.assertEqual(len(messages), 4)
+        self.assertIn("First event.", messages[1].content)
+        self.assertNotIn("First event.", messages[3].content)
+        self.assertIn("Second event.", messages[3].content)
+
+        # Releasing the agent drops the conversation
+        agent.release()
+        self.assertEqual(agent.session, [])
+
 
 class TestControllers(unittest.TestCase):
     """Test cases for the game controllers."""
@@ -342,6 +381,31 @@ class TestControllers(unittest.TestCase):
         # Check that actions were created
         self.assertGreater(len(self.game_controller.game_state.actions), 0)
 
+    def test_event_callbacks(self):
+        """Test that queued callbacks run in order before flush_events returns."""
+        self.config["ai_models"] = [{"provider": "random", "model": "random"}]
+        self.game_controller.initialize_game(self.player_names)
+
+        received = []
+
+        async def on_message(message):
+            received.append(("message", message.sender_id))
+
+        self.game_controller.register_callback(
+            "game_event", lambda event: received.append(("event", event.event_type))
+        )
+        self.game_controller.register_callback("message", on_message)
+
+        self.game_controller.run_phase()
+        self.game_controller.flush_events()
+
+        alive = len(self.game_controller.game_state.alive_players)
+        self.assertEqual(
+            [r for r in received if r[0] == "message"],
+            [("message", m.sender_id) for m in self.game_controller.game_state.messages],
+        )
+        self.assertEqual(len([r for r in received if r[0] == "message"]), alive)
+
 
 class TestGame(unittest.TestCase):
     """Test cases for the main game class."""